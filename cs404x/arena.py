@@ -1,37 +1,43 @@
 import asyncio
 import dataclasses
 import logging
-from typing import Iterable
+from typing import Any, Iterable, Optional
 
 import msgspec
-from websockets import ConnectionClosed, WebSocketServerProtocol, broadcast
+from websockets import ConnectionClosed, WebSocketServerProtocol
 
 from cs404x.auctioneer import Auctioneer
 from cs404x.messages import Message, MessageKind
 
 logger = logging.getLogger(__name__)
 
+_ENCODER = msgspec.msgpack.Encoder()
+
+# Outgoing messages buffered per participant before it is considered stalled.
+_SEND_QUEUE_SIZE = 64
+
 
 @dataclasses.dataclass
 class Participant:
     user_name: str
     user_id: str
     websocket: WebSocketServerProtocol
+    out_queue: asyncio.Queue[bytes] = dataclasses.field(
+        default_factory=lambda: asyncio.Queue(maxsize=_SEND_QUEUE_SIZE),
+        compare=False,
+        repr=False,
+    )
+    writer: Optional[asyncio.Task] = dataclasses.field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+    stalled: bool = dataclasses.field(default=False, compare=False)
 
     def __hash__(self):
         return hash((self.user_name, self.user_id))
 
 
-async def broadcast_message(
-    participants: Iterable[Participant],
-    message: Message,
-):
-    return broadcast(
-        websockets=(participant.websocket for participant in participants),
-        message=msgspec.msgpack.encode(message),
-    )
-
-
 class Arena:
     _MIN_PLAYERS = 2
     _TIMEOUT_START = 0
@@ -49,6 +55,9 @@ class Arena:
 
         self._auction = None
 
+        # Closing handshakes of stalled participants, kept until done
+        self._closing = set()
+
     @property
     def in_game(self) -> bool:
         return self._auction is not None
@@ -60,8 +69,14 @@ class Arena:
                 participant.user_name,
                 participant.user_id,
             )
-            self._participants_waiting.discard(participant)
-            self._participants_in_game.pop(participant.user_id, None)
+            self._remove(participant)
+
+    def _remove(self, participant: Participant):
+        self._participants_waiting.discard(participant)
+        self._participants_in_game.pop(participant.user_id, None)
+
+        if participant.writer is not None:
+            participant.writer.cancel()
 
     async def register(self, participant: Participant):
         async with self._registration_lock:
@@ -71,8 +86,12 @@ class Arena:
                 participant.user_id,
             )
             self._participants_waiting.add(participant)
+            participant.writer = asyncio.create_task(
+                self._write_messages(participant)
+            )
 
-            await self._send_message(
+            # Queued rather than sent, to not hold the lock while writing
+            self._send_message(
                 participant,
                 Message(
                     MessageKind.QUEUED,
@@ -109,7 +128,7 @@ class Arena:
 
             await asyncio.sleep(self._TIMEOUT_START)
 
-            await broadcast_message(
+            self._broadcast_message(
                 self._participants_waiting,
                 Message(MessageKind.START),
             )
@@ -125,7 +144,13 @@ class Arena:
     async def _run_round(self) -> bool:
         self._auction.start_round()
 
-        await self._request_bids(self._participants_in_game.values())
+        # Participants may (de)register while the round is in progress
+        participants = tuple(self._participants_in_game.values())
+
+        await self._request_bids(
+            participants,
+            self._auction.build_round_delta(),
+        )
 
         async with self._all_bids_received_event:
             try:
@@ -145,8 +170,8 @@ class Arena:
 
         round_summary = self._auction.finish_round()
 
-        await broadcast_message(
-            self._participants_in_game.values(),
+        self._broadcast_message(
+            participants,
             message=Message(
                 MessageKind.ROUND_TELEMETRY,
                 value=round_summary,
@@ -167,20 +192,57 @@ class Arena:
                 players=self._participants_in_game,
             )
 
-    async def _finish_auction(self):
-        winners = set(self._auction.compute_auction_winners())
-
-        for participant_id, participant in self._participants_in_game.items():
-            participant_message = {
-                "won": participant_id in winners,
-                "participants": len(self._participants_in_game),
-            }
+            # Only `my_bot_id` differs, the rest is encoded once
+            static_summary = msgspec.Raw(
+                _ENCODER.encode(self._auction.static_summary)
+            )
+            all_participants_state = msgspec.Raw(
+                _ENCODER.encode(
+                    [
+                        self._auction.get_participant_state(participant_id)
+                        for participant_id in self._participants_in_game
+                    ]
+                )
+            )
 
-            asyncio.create_task(
+            for participant in tuple(self._participants_in_game.values()):
                 self._send_message(
                     participant,
-                    Message(MessageKind.END, value=participant_message),
+                    Message(
+                        MessageKind.INIT,
+                        value={
+                            "static_summary": static_summary,
+                            "bots": all_participants_state,
+                            "my_bot_id": participant.user_id,
+                        },
+                    ),
                 )
+
+    async def _finish_auction(self):
+        winners = set(self._auction.compute_auction_winners())
+
+        participants_count = len(self._participants_in_game)
+
+        # The END message only differs on whether the participant won.
+        won_payload = _ENCODER.encode(
+            Message(
+                MessageKind.END,
+                value={"won": True, "participants": participants_count},
+            )
+        )
+        lost_payload = _ENCODER.encode(
+            Message(
+                MessageKind.END,
+                value={"won": False, "participants": participants_count},
+            )
+        )
+
+        for participant_id, participant in tuple(
+            self._participants_in_game.items()
+        ):
+            self._enqueue(
+                participant,
+                won_payload if participant_id in winners else lost_payload,
             )
 
         async with self._registration_lock:
@@ -193,39 +255,71 @@ class Arena:
 
             self._start_if_possible()
 
-    async def _request_bids(self, participants: Iterable[Participant]):
-        summary_auction_state = self._auction.summary_state
-        all_participants_state = {
-            participant: self._auction.get_participant_state(participant)
-            for participant in self._participants_in_game.keys()
-        }
-
-        for participant in participants:
-            participant_state = {
-                **summary_auction_state,
-                "my_bot_details": all_participants_state[participant.user_id],
-                "bots": list(all_participants_state.values()),
-            }
+    async def _request_bids(
+        self,
+        participants: Iterable[Participant],
+        round_delta: dict[str, Any],
+    ):
+        # Participants rebuild the auction state from INIT, so every one of
+        # them gets the same delta.
+        self._broadcast_message(
+            participants,
+            Message(kind=MessageKind.BID_REQUEST_DELTA, value=round_delta),
+        )
 
-            asyncio.create_task(
-                self._send_message(
-                    participant,
-                    Message(
-                        kind=MessageKind.BID_REQUEST,
-                        value=participant_state,
-                    ),
-                )
-            )
+    def _broadcast_message(
+        self,
+        participants: Iterable[Participant],
+        message: Message,
+    ):
+        # Encoded once, then queued like any other message so that every
+        # participant receives its messages in order.
+        payload = _ENCODER.encode(message)
+
+        # Stalled participants are removed while enqueuing
+        for participant in tuple(participants):
+            self._enqueue(participant, payload)
+
+    def _enqueue(self, participant: Participant, payload: bytes):
+        if participant.stalled:
+            return
 
-    async def _send_message(self, participant: Participant, message: Message):
         try:
-            await participant.websocket.send(msgspec.msgpack.encode(message))
-        except ConnectionClosed:
-            await self.deregister(participant)
+            participant.out_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Participant %s (%s) is not keeping up, disconnecting.",
+                participant.user_name,
+                participant.user_id,
+            )
+            participant.stalled = True
+            self._remove(participant)
+
+            close_task = asyncio.create_task(
+                participant.websocket.close(code=1008)
+            )
+            self._closing.add(close_task)
+            close_task.add_done_callback(self._closing.discard)
+
+    async def _write_messages(self, participant: Participant):
+        while True:
+            payload = await participant.out_queue.get()
+
+            try:
+                await participant.websocket.send(payload)
+            except ConnectionClosed:
+                await self.deregister(participant)
+                return
+
+    def _send_message(self, participant: Participant, message: Message):
+        self._enqueue(participant, _ENCODER.encode(message))
 
     async def _on_bid_reply(self, participant: Participant, message: Message):
+        if participant.stalled:
+            return
+
         if participant in self._participants_waiting:
-            await self._send_message(
+            self._send_message(
                 participant,
                 Message(
                     MessageKind.WARNING, value="Can't bid while in queue."
@@ -239,7 +333,7 @@ class Arena:
         )
 
         if not within_budget:
-            await self._send_message(
+            self._send_message(
                 participant,
                 Message(
                     MessageKind.WARNING,
@@ -250,11 +344,13 @@ class Arena:
             await self._count_bids()
 
     async def _count_bids(self):
-        async with self._all_bids_received_event, self._registration_lock:
-            self._bids_received += 1
+        # No need for locks to count, the event loop runs one task at a time.
+        self._bids_received += 1
+
+        if self._bids_received == len(self._participants_in_game):
+            self._bids_received = 0
 
-            if self._bids_received == len(self._participants_in_game):
-                self._bids_received = 0
+            async with self._all_bids_received_event:
                 self._all_bids_received_event.notify_all()
 
     async def on_message(
@@ -11,31 +11,37 @@ takes inspiration, was written by Alexander Carver, Department of Computing,
 Imperial College London. Further precious input for the coursework came from
 Charlotte Roman, Department of Mathematics, University of Warwick.
 """
-import dataclasses
 import datetime
 import random
 from collections.abc import Sequence
 from typing import Any, Optional
 
+import msgspec
 
-class ParticipantState:
-    def __init__(self, budget: float, paintings: Sequence[str]):
-        self.paintings_owned = {painting: 0 for painting in paintings}
 
-        self.budget = budget
-        self.score = 0
-        self.current_bid = None
+class ParticipantState(msgspec.Struct, omit_defaults=True):
+    """State of a participant during an auction, as sent to the bots.
 
-    def to_dict(self):
-        return {
-            "paintings": self.paintings_owned,
-            "budget": self.budget,
-            "score": self.score,
-        }
+    Attributes:
+        bot_unique_id: ID (unique) of the participant.
+        bot_name: Same as `bot_unique_id`, kept for compatibility with the
+            local bots.
+        paintings_owned: Number of paintings owned, by artist.
+        budget: Budget left to spend.
+        score: 1 for a full collection, 0 otherwise.
+        current_bid: Bid for the round in progress, never sent before the
+            first round starts.
+    """
+
+    bot_unique_id: str
+    bot_name: str
+    paintings_owned: dict[str, int] = msgspec.field(name="paintings")
+    budget: float
+    score: int
+    current_bid: Optional[int] = None
 
 
-@dataclasses.dataclass
-class RoundSummary:
+class RoundSummary(msgspec.Struct):
     """Overall summary of an auction round.
 
     Attributes:
@@ -77,25 +83,34 @@ class Auctioneer:
             "Picasso": 2,
         }
         self._target_collection = target_collection
+        self._target_sorted = sorted(self._target_collection, reverse=True)
 
         self._players = {
             player: ParticipantState(
+                bot_unique_id=player,
+                bot_name=player,
+                paintings_owned={
+                    painting: 0 for painting in self._artists_and_values
+                },
                 budget=self._starting_budget,
-                paintings=self._artists_and_values.keys(),
+                score=0,
             )
             for player in players
         }
 
         random.seed()
 
+        self._artists = list(self._artists_and_values.keys())
+
+        # Painting order as indices into `self._artists`, cheaper to send
         self._painting_order = painting_order
 
         if self._painting_order is None:
             # Random painting order if none given
-            artists = list(self._artists_and_values.keys())
-            self._painting_order = [
-                artists[random.randint(0, 3)] for _ in range(self._round_limit)
-            ]
+            self._painting_order = random.choices(
+                range(len(self._artists)),
+                k=self._round_limit,
+            )
 
         # Winner pays 1nd price auction
         self._winner_pays = 1
@@ -104,38 +119,52 @@ class Auctioneer:
         self._winner_ids = []
         self._amounts_paid = []
 
+        # Summary fields which remain the same throughout the auction
+        self._static_summary = {
+            "winner_pays": self._winner_pays,
+            "artists_and_values": self._artists_and_values,
+            "round_limit": self._round_limit,
+            "starting_budget": self._starting_budget,
+            "artists": self._artists,
+            "painting_order": self._painting_order,
+            "target_collection": self._target_collection,
+        }
+
     @property
     def finished(self) -> bool:
         return (
             self._current_round == self._round_limit - 1
         ) or self._player_won
 
+    @property
+    def _current_painting(self) -> str:
+        return self._artists[self._painting_order[self._current_round]]
+
     def start_round(self):
         for state in self._players.values():
             state.current_bid = 0
 
     @property
-    def summary_state(self) -> dict[str, Any]:
+    def static_summary(self) -> dict[str, Any]:
+        return self._static_summary
+
+    def build_round_delta(self) -> dict[str, Any]:
+        """What changed since the previous round.
+
+        Together with `static_summary` and the initial participant states,
+        this is enough for a participant to rebuild the full auction state.
+        """
         return {
             "current_round": self._current_round,
-            "winner_pays": self._winner_pays,
-            "artists_and_values": self._artists_and_values,
-            "round_limit": self._round_limit,
-            "starting_budget": self._starting_budget,
-            "painting_order": self._painting_order,
-            "target_collection": self._target_collection,
             "current_painting": self._painting_order[self._current_round],
-            "winner_ids": self._winner_ids,
-            "amounts_paid": self._amounts_paid,
+            "last_winner": self._winner_ids[-1] if self._winner_ids else None,
+            "last_amount": (
+                self._amounts_paid[-1] if self._amounts_paid else None
+            ),
         }
 
-    def get_participant_state(self, user_id: str):
-        state = self._players[user_id].to_dict()
-
-        state["bot_unique_id"] = user_id
-        state["bot_name"] = user_id
-
-        return state
+    def get_participant_state(self, user_id: str) -> ParticipantState:
+        return self._players[user_id]
 
     def register_bid(self, player_id: str, bid: float) -> bool:
         # "Round" bids as done in the original Auctioneer (used for marking).
@@ -156,7 +185,7 @@ class Auctioneer:
             auction_start=self._auction_start,
             current_round=self._current_round,
             round_winner=self._winner_ids[self._current_round],
-            painting=self._painting_order[self._current_round],
+            painting=self._current_painting,
             amount_paid=self._amounts_paid[self._current_round],
         )
 
@@ -165,17 +194,25 @@ class Auctioneer:
         return round_summary
 
     def _compute_round_winner(self):
-        # Sort the bots based on their current bid. If there is a tie, randomly break the tie
-        sorted_players = sorted(
-            self._players,
-            key=lambda p: (self._players[p].current_bid, random.random()),
-            reverse=True,
-        )
+        # Rank the bots based on their current bid. If there is a tie, randomly break the tie
+        ranked_players = [
+            (state.current_bid, random.getrandbits(32), player)
+            for player, state in self._players.items()
+        ]
+
+        if self._winner_pays == 1:
+            # Only the highest bidder matters in a 1st price auction
+            *_, winner_id = max(ranked_players)
+        else:
+            ranked_players.sort(reverse=True)
 
-        bid_position_to_pay = min(self._winner_pays, len(sorted_players)) - 1
+            bid_position_to_pay = (
+                min(self._winner_pays, len(ranked_players)) - 1
+            )
+
+            # Award the painting to the winning bot, the first in the sorted array of bots
+            *_, winner_id = ranked_players[bid_position_to_pay]
 
-        # Award the painting to the winning bot, the first in the sorted array of bots
-        winner_id = sorted_players[bid_position_to_pay]
         winner_state = self._players[winner_id]
 
         # Subtract bid value from the winning bot's budget
@@ -183,8 +220,7 @@ class Auctioneer:
         self._amounts_paid.append(winner_state.current_bid)
 
         # Add painting to winner's paintings
-        current_painting = self._painting_order[self._current_round]
-        winner_state.paintings_owned[current_painting] += 1
+        winner_state.paintings_owned[self._current_painting] += 1
         self._winner_ids.append(winner_id)
 
     def _update_scores(self):
@@ -198,23 +234,21 @@ class Auctioneer:
         for player_state in self._players.values():
             player_state.score = 0
 
-            # Sort this bot's painting counts, and target counts, with highest value first
+            # Sort this bot's painting counts with highest value first (targets are pre-sorted)
             bot_painting_counts_sorted = sorted(
                 player_state.paintings_owned.values(),
                 reverse=True,
             )
-            target_painting_counts_sorted = sorted(
-                self._target_collection,
-                reverse=True,
-            )
 
-            # Subtract target painting counts from this bot's painting count
-            paintings_needed = [
-                target - bot_painting_counts_sorted[index]
-                for index, target in enumerate(target_painting_counts_sorted)
-            ]
-            # If all the paintings needed counts are 0 or less, then the collection is complete
-            if max(paintings_needed) < 1:
+            # The collection is complete if this bot has at least the target
+            # count for every painting
+            if all(
+                target <= owned
+                for target, owned in zip(
+                    self._target_sorted,
+                    bot_painting_counts_sorted,
+                )
+            ):
                 player_state.score = 1
                 self._player_won = True
 
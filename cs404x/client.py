@@ -2,7 +2,9 @@ import argparse
 import asyncio
 import csv
 import dataclasses
+import io
 import logging
+import sys
 import uuid
 from collections.abc import Callable
 from importlib.util import module_from_spec, spec_from_file_location
@@ -16,34 +18,124 @@ from websockets import WebSocketClientProtocol, connect
 
 from cs404x.messages import Message, MessageKind
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder(Message)
+
+
+_TELEMETRY_FIELDS = (
+    "auction_start",
+    "current_round",
+    "round_winner_is_you",
+    "round_winner",
+    "painting",
+    "amount_paid",
+)
+
 
 def save_auction_telemetry(path: Path, telemetry: list[dict[Any, Any]]):
-    with open(path, "w", encoding="utf8") as file:
-        csv_writer = csv.DictWriter(
-            file,
-            fieldnames=[
-                "auction_start",
-                "current_round",
-                "round_winner_is_you",
-                "round_winner",
-                "painting",
-                "amount_paid",
-            ],
-        )
+    buffer = io.StringIO()
 
-        csv_writer.writeheader()
-        csv_writer.writerows(telemetry)
+    csv_writer = csv.writer(buffer)
+    csv_writer.writerow(_TELEMETRY_FIELDS)
+    csv_writer.writerows(
+        [row[field] for field in _TELEMETRY_FIELDS] for row in telemetry
+    )
+
+    path.write_text(buffer.getvalue(), encoding="utf8")
 
 
 @dataclasses.dataclass
-class ClientState:
+class AuctionContext:
+    """Local copy of the auction state, kept up to date from bid requests.
+
+    Attributes:
+        summary: Auction summary as passed on to the bot, minus the bots.
+        bots: State of every bot in the auction, by their unique ID.
+        my_bot_id: Unique ID of this client's bot.
+        artists: Artist names, paintings are sent as indices into this list.
+    """
+
+    summary: dict[str, Any]
+    bots: dict[str, dict[str, Any]]
+    my_bot_id: str
+    artists: list[str]
+
+    @classmethod
+    def from_init(cls, value: dict[str, Any]) -> "AuctionContext":
+        summary = value["static_summary"]
+        bots = value["bots"]
+        my_bot_id = value["my_bot_id"]
+        artists = summary.pop("artists")
+
+        # Bots expect artist names, not indices
+        summary["painting_order"] = [
+            artists[painting] for painting in summary["painting_order"]
+        ]
+        summary["winner_ids"] = []
+        summary["amounts_paid"] = []
+
+        return cls(
+            summary=summary,
+            bots={bot["bot_unique_id"]: bot for bot in bots},
+            my_bot_id=my_bot_id,
+            artists=artists,
+        )
+
+    def apply_delta(self, delta: dict[str, Any]):
+        last_winner = delta["last_winner"]
+
+        if last_winner is not None:
+            # Mirror what the auctioneer did with the previous round's winner
+            last_round = delta["current_round"] - 1
+            painting = self.summary["painting_order"][last_round]
+            winner = self.bots[last_winner]
+            winner["budget"] -= delta["last_amount"]
+            winner["paintings"][painting] += 1
+
+            self.summary["winner_ids"].append(last_winner)
+            self.summary["amounts_paid"].append(delta["last_amount"])
+
+        self.summary["current_round"] = delta["current_round"]
+        self.summary["current_painting"] = self.artists[
+            delta["current_painting"]
+        ]
+
+    def bid_arguments(self) -> dict[str, Any]:
+        # Bots get their own copy of everything mutable, as they did when
+        # every request was decoded from scratch, so they can't corrupt the
+        # local state.
+        summary = self.summary
+
+        return {
+            **summary,
+            "artists_and_values": dict(summary["artists_and_values"]),
+            "painting_order": list(summary["painting_order"]),
+            "target_collection": list(summary["target_collection"]),
+            "winner_ids": list(summary["winner_ids"]),
+            "amounts_paid": list(summary["amounts_paid"]),
+            "bots": [_copy_bot(bot) for bot in self.bots.values()],
+            "my_bot_details": _copy_bot(self.bots[self.my_bot_id]),
+        }
+
+
+def _copy_bot(bot: dict[str, Any]) -> dict[str, Any]:
+    return {**bot, "paintings": dict(bot["paintings"])}
+
+
+class ClientState(msgspec.Struct):
     bot: Any
     bot_cls: type
     telemetry_base: Path
     participant_id: Optional[str] = None
+    auction: Optional[AuctionContext] = None
     auctions_won: int = 0
     auctions_total: int = 0
-    current_auction_telemetry: list[Any] = dataclasses.field(
+    current_auction_telemetry: list[Any] = msgspec.field(
         default_factory=list,
     )
 
@@ -72,9 +164,8 @@ async def _on_queued(
     message: Message,
 ) -> ClientState:
     logging.info("Waiting in the queue: %s", message.value)
-    return dataclasses.replace(
-        state, participant_id=message.value["participant_id"],
-    )
+    state.participant_id = message.value["participant_id"]
+    return state
 
 
 async def _on_start(
@@ -83,7 +174,8 @@ async def _on_start(
     message: Message,
 ) -> ClientState:
     logging.info("Auction starting...")
-    return dataclasses.replace(state, bot=state.bot_cls())
+    state.bot = state.bot_cls()
+    return state
 
 
 async def _on_end(
@@ -98,28 +190,19 @@ async def _on_end(
         state.current_auction_telemetry,
     )
 
+    state.current_auction_telemetry = []
+
     if message.value["participants"] == 1:
         logging.info(
             "Auction terminatted early (only 1 participant): ignored."
         )
-
-        return dataclasses.replace(
-            state,
-            current_auction_telemetry=[],
-        )
     else:
-        auctions_won = (
-            state.auctions_won + 1
-            if message.value["won"]
-            else state.auctions_won
-        )
+        state.auctions_total += 1
 
-        return dataclasses.replace(
-            state,
-            auctions_total=state.auctions_total + 1,
-            auctions_won=auctions_won,
-            current_auction_telemetry=[],
-        )
+        if message.value["won"]:
+            state.auctions_won += 1
+
+    return state
 
 
 async def _on_telemetry(
@@ -149,19 +232,31 @@ async def _on_telemetry(
     return state
 
 
-async def _on_bid_request(
+async def _on_init(
+    websocket: WebSocketClientProtocol,
+    state: ClientState,
+    message: Message,
+) -> ClientState:
+    logging.debug("Received auction state.")
+    state.auction = AuctionContext.from_init(message.value)
+    return state
+
+
+async def _on_bid_request_delta(
     websocket: WebSocketClientProtocol,
     state: ClientState,
     message: Message,
 ) -> ClientState:
     logging.debug("Received bid request.")
 
-    bid = state.bot.get_bid(**message.value)
+    state.auction.apply_delta(message.value)
+
+    bid = state.bot.get_bid(**state.auction.bid_arguments())
 
     logging.debug("Bidding %f", bid)
 
     await websocket.send(
-        msgspec.msgpack.encode(Message(MessageKind.BID_REPLY, value=bid))
+        _ENCODER.encode(Message(MessageKind.BID_REPLY, value=bid))
     )
 
     return state
@@ -171,6 +266,17 @@ EventHandler = Callable[
     [WebSocketClientProtocol, ClientState, Message], Awaitable[ClientState]
 ]
 
+_HANDLERS: dict[MessageKind, EventHandler] = {
+    MessageKind.INFO: _on_info,
+    MessageKind.WARNING: _on_warning,
+    MessageKind.QUEUED: _on_queued,
+    MessageKind.START: _on_start,
+    MessageKind.END: _on_end,
+    MessageKind.ROUND_TELEMETRY: _on_telemetry,
+    MessageKind.INIT: _on_init,
+    MessageKind.BID_REQUEST_DELTA: _on_bid_request_delta,
+}
+
 
 async def client(
     *,
@@ -189,21 +295,11 @@ async def client(
         telemetry_base=telemetry_base,
     )
 
-    async with connect(arena_uri) as websocket:
+    async with connect(arena_uri, compression=None) as websocket:
         async for message in websocket:
-            message: Message = msgspec.msgpack.decode(message, type=Message)
-
-            on_event_handler: dict[MessageKind, EventHandler] = {
-                MessageKind.INFO: _on_info,
-                MessageKind.WARNING: _on_warning,
-                MessageKind.QUEUED: _on_queued,
-                MessageKind.START: _on_start,
-                MessageKind.END: _on_end,
-                MessageKind.ROUND_TELEMETRY: _on_telemetry,
-                MessageKind.BID_REQUEST: _on_bid_request,
-            }
-
-            state = await on_event_handler[message.kind](
+            message: Message = _DECODER.decode(message)
+
+            state = await _HANDLERS[message.kind](
                 websocket,
                 state,
                 message,
@@ -276,6 +372,9 @@ def main():
 
     args.telemetry_base.mkdir(exist_ok=True)
 
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(
         client(
             username=args.username,
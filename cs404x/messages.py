@@ -15,9 +15,16 @@ class MessageKind(IntEnum):
     ROUND_TELEMETRY = auto()
 
     BID_REPLY = auto()
-    BID_REQUEST = auto()
+    BID_REQUEST_DELTA = auto()
 
+    INIT = auto()
+
+
+class Message(msgspec.Struct, array_like=True):
+    """Message exchanged between the arena and its clients.
+
+    Encoded as a `[kind, value]` array, leaving out the field names.
+    """
 
-class Message(msgspec.Struct):
     kind: MessageKind
     value: Optional[Any] = None
@@ -1,6 +1,7 @@
 import argparse
 import asyncio
 import logging
+import sys
 import uuid
 from urllib.parse import parse_qs, urlparse
 
@@ -11,6 +12,13 @@ from websockets.server import serve
 from cs404x.arena import Arena, Participant
 from cs404x.messages import Message
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_DECODER = msgspec.msgpack.Decoder(Message)
+
 arena = Arena()
 
 _USERNAME_QUERY = "username"
@@ -45,14 +53,22 @@ async def _arena_entry(websocket: WebSocketServerProtocol, uri: str):
 
     try:
         async for message in websocket:
-            message = msgspec.msgpack.decode(message, type=Message)
+            message = _DECODER.decode(message)
             await arena.on_message(participant, message)
     finally:
         await arena.deregister(participant)
 
 
 async def _server(*, address: str, port: int):
-    async with serve(_arena_entry, address, port):
+    # Messages are small msgpack payloads, not worth compressing per frame.
+    async with serve(
+        _arena_entry,
+        address,
+        port,
+        compression=None,
+        max_size=2**20,
+        max_queue=64,
+    ):
         await asyncio.Future()
 
 
@@ -84,6 +100,9 @@ def main():
 
     args = parser.parse_args()
 
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(
         _launch_arena(
             address=args.address,
@@ -0,0 +1,87 @@
+import random
+
+import msgspec
+import pytest
+
+from cs404x.auctioneer import Auctioneer
+from cs404x.client import AuctionContext
+
+_PLAYERS = ["alice", "bob", "carol", "dave"]
+
+
+def _wire(value):
+    return msgspec.msgpack.decode(msgspec.msgpack.encode(value))
+
+
+def _init_message(auction: Auctioneer, my_bot_id: str):
+    return _wire(
+        {
+            "static_summary": auction.static_summary,
+            "bots": [auction.get_participant_state(p) for p in _PLAYERS],
+            "my_bot_id": my_bot_id,
+        }
+    )
+
+
+def _expected_arguments(auction, my_bot_id, round_summaries):
+    summary = dict(_wire(auction.static_summary))
+    artists = summary.pop("artists")
+    painting_order = [artists[p] for p in summary["painting_order"]]
+    delta = auction.build_round_delta()
+    bots = [_wire(auction.get_participant_state(p)) for p in _PLAYERS]
+
+    # Bids are never shared with the other participants
+    for bot in bots:
+        bot.pop("current_bid", None)
+
+    return {
+        **summary,
+        "painting_order": painting_order,
+        "current_round": delta["current_round"],
+        "current_painting": painting_order[delta["current_round"]],
+        "winner_ids": [r.round_winner for r in round_summaries],
+        "amounts_paid": [r.amount_paid for r in round_summaries],
+        "bots": bots,
+        "my_bot_details": bots[_PLAYERS.index(my_bot_id)],
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_context_matches_auctioneer(seed: int):
+    rng = random.Random(seed)
+    auction = Auctioneer(players=_PLAYERS)
+    context = AuctionContext.from_init(_init_message(auction, "bob"))
+    round_summaries = []
+
+    while True:
+        auction.start_round()
+        context.apply_delta(_wire(auction.build_round_delta()))
+
+        assert context.bid_arguments() == _expected_arguments(
+            auction, "bob", round_summaries
+        )
+
+        for player in _PLAYERS:
+            # Occasionally over budget, which the auctioneer treats as 0
+            auction.register_bid(player, rng.randint(0, 1100))
+
+        round_summaries.append(auction.finish_round())
+
+        if auction.finished:
+            break
+
+    assert len(round_summaries) > 1
+
+
+def test_bid_arguments_are_copies():
+    auction = Auctioneer(players=_PLAYERS)
+    context = AuctionContext.from_init(_init_message(auction, "alice"))
+    context.apply_delta(_wire(auction.build_round_delta()))
+
+    arguments = context.bid_arguments()
+    arguments["bots"][0]["paintings"]["Picasso"] = 100
+    arguments["my_bot_details"]["budget"] = 0
+    arguments["winner_ids"].append("mallory")
+    arguments["painting_order"].clear()
+
+    assert context.bid_arguments() == _expected_arguments(auction, "alice", [])